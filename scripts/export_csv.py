@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+export_csv.py
+
+Export PR data stored by `gh_pr_times.py --format sqlite` to CSV files that
+analyze_pr_times.py can read.
+
+Usage:
+  # Export every SQLite store in ./data to a CSV next to it
+  python export_csv.py
+
+  # Export specific stores to another directory
+  python export_csv.py --input data/org_repo.sqlite --out-dir ./exports
+
+  # Replace CSV files that already exist
+  python export_csv.py --force
+"""
+
+import argparse
+import csv
+import glob
+import os
+import sqlite3
+import sys
+from typing import List
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Export SQLite PR data to CSV")
+    p.add_argument("--input", nargs="+", default=None, help="SQLite files to export (if not provided, exports all in --data-dir)")
+    p.add_argument("--data-dir", type=str, default="./data", help="Directory to scan for .sqlite files when --input not provided")
+    p.add_argument("--out-dir", type=str, default=None, help="Output directory for CSV files (default: next to each input)")
+    p.add_argument("--force", action="store_true", help="Overwrite CSV files that already exist")
+    return p.parse_args()
+
+
+def find_sqlite_files(data_dir: str) -> List[str]:
+    """Find all SQLite stores in the data directory."""
+    if not os.path.exists(data_dir):
+        return []
+
+    return sorted(glob.glob(os.path.join(data_dir, "*.sqlite")))
+
+
+def export_sqlite_to_csv(db_path: str, csv_path: str) -> int:
+    """Write every PR row to CSV in the same format gh_pr_times.py writes. Returns the row count."""
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.execute("SELECT * FROM prs ORDER BY repo, created_at DESC")
+        fieldnames = [col[0] for col in cursor.description]
+        draft_i = fieldnames.index("draft")
+        count = 0
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for row in cursor:
+                row = list(row)
+                # SQLite stores booleans as 0/1; the CSV format uses True/False
+                if row[draft_i] is not None:
+                    row[draft_i] = bool(row[draft_i])
+                writer.writerow(row)
+                count += 1
+    finally:
+        conn.close()
+    return count
+
+
+def main() -> None:
+    args = parse_args()
+    db_paths = args.input or find_sqlite_files(args.data_dir)
+    if not db_paths:
+        print(f"❌ Error: No SQLite files found in {args.data_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+
+    for db_path in db_paths:
+        base = os.path.splitext(os.path.basename(db_path))[0]
+        out_dir = args.out_dir or os.path.dirname(db_path)
+        csv_path = os.path.join(out_dir, f"{base}.csv")
+        # The default target is usually the CSV store gh_pr_times.py writes, so never clobber it silently
+        if os.path.exists(csv_path) and not args.force:
+            print(f"⚠️  Warning: {csv_path} already exists; skipping (use --out-dir or --force)", file=sys.stderr)
+            continue
+        try:
+            count = export_sqlite_to_csv(db_path, csv_path)
+        except sqlite3.Error as e:
+            print(f"⚠️  Warning: Could not export {db_path}: {e}", file=sys.stderr)
+            continue
+        print(f"✓ Exported {count} PRs from {db_path} to {csv_path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
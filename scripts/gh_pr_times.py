@@ -2,7 +2,8 @@
 """
 gh_pr_times.py
 
-Fetch PR timing metrics from one or more GitHub repositories and export to CSV.
+Fetch PR timing metrics from one or more GitHub repositories and export to CSV
+(or to SQLite with --format sqlite; see export_csv.py).
 
 Metrics captured:
 - created_at, closed_at, merged_at
@@ -19,8 +20,9 @@ Usage:
   2. Run: python gh_pr_times.py --repos org1/repo1 org2/repo2 --since 2025-01-01 --until 2025-10-21 --out pr_times.csv
 
 Notes:
-- The script uses the GitHub REST API v3.
-- It paginates PRs and reviews.
+- New PRs are fetched with the GitHub GraphQL API v4, one query per page of PRs.
+- The REST API v3 is used for single-PR refreshes and for the rare PR with
+  more than 100 reviews or comments.
 - "Time to first review" is based on the earliest submitted review, not comments.
 - Token can also be set via GITHUB_TOKEN or GH_TOKEN environment variable.
 """
@@ -28,12 +30,22 @@ Notes:
 import argparse
 import csv
 import os
+import queue
+import random
+import sqlite3
 import sys
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import chain
 from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
+import orjson
 import requests
+import requests_cache
 from dotenv import load_dotenv
 from tqdm import tqdm
 
@@ -42,10 +54,94 @@ load_dotenv()
 
 # Constants
 ISO_FORMAT = "%Y-%m-%d"
+SEARCH_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 API_ROOT = "https://api.github.com"
 DEFAULT_RETRIES = 3
 DEFAULT_TIMEOUT = 30.0
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+GRAPHQL_URL = f"{API_ROOT}/graphql"
 PER_PAGE_LIMIT = 100
+CSV_WRITE_BATCH = 100
+DEFAULT_HTTP_CACHE = ".gh_http_cache.sqlite"
+GRAPHQL_PAGE_SIZE = 50
+GHOST_LOGIN = "ghost"
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+MAX_IN_FLIGHT_REQUESTS = 48  # Per token across all repo processes; below GitHub's ~100 concurrent-request secondary limit
+REQUEST_WORKERS = 32
+PAGE_FETCH_WORKERS = 8
+PREFETCH_QUEUE_SIZE = 2 * GRAPHQL_PAGE_SIZE  # Lets the next page download while the current one is written
+MAX_CONCURRENT_PRS = 10  # Open PRs refreshed at once per repo; requests in flight are still capped per process
+MAX_PARALLEL_REPOS = 4  # Repo processes sharing one token; each gets an equal share of MAX_IN_FLIGHT_REQUESTS
+
+# GraphQL states matching the REST "state" filter (None means all states)
+GRAPHQL_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": None,
+}
+
+CSV_FIELDNAMES = [
+    "repo", "number", "title", "url", "author", "draft",
+    "created_at", "closed_at", "merged_at",
+    "additions", "deletions", "changed_files", "commits",
+    "reviews_count", "first_review_at", "time_to_first_review_hours",
+    "time_to_merge_hours", "open_time_hours",
+    "comments_count", "comment_authors", "approvals_count", "approval_authors"
+]
+
+# Column types for the SQLite store (everything else is TEXT)
+SQLITE_COLUMN_TYPES = {
+    "number": "INTEGER",
+    "draft": "INTEGER",
+    "additions": "INTEGER",
+    "deletions": "INTEGER",
+    "changed_files": "INTEGER",
+    "commits": "INTEGER",
+    "reviews_count": "INTEGER",
+    "time_to_first_review_hours": "REAL",
+    "time_to_merge_hours": "REAL",
+    "open_time_hours": "REAL",
+    "comments_count": "INTEGER",
+    "approvals_count": "INTEGER",
+}
+
+# Search API qualifiers matching the REST "state" filter
+SEARCH_STATE_QUALIFIERS = {
+    "open": "is:open",
+    "closed": "is:closed",
+    "all": "",
+}
+
+# Everything process_pr_data needs for a PR, fetched in a single round trip.
+# Review comments are counted through each review, since every inline comment
+# belongs to the review its author submitted.
+PR_GRAPHQL_FIELDS = """
+number title url isDraft createdAt closedAt mergedAt
+additions deletions changedFiles
+author { __typename login }
+commits { totalCount }
+reviews(first: 100) {
+  pageInfo { hasNextPage }
+  nodes { state submittedAt author { __typename login } comments { totalCount } }
+}
+comments(first: 100) {
+  pageInfo { hasNextPage }
+  nodes { author { __typename login } }
+}
+"""
+
+PRS_GRAPHQL_QUERY = """
+query($owner: String!, $repo: String!, $cursor: String, $states: [PullRequestState!], $pageSize: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(first: $pageSize, after: $cursor, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { %s }
+    }
+  }
+}
+""" % PR_GRAPHQL_FIELDS
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Export PR timing metrics from GitHub repos to CSV")
@@ -54,12 +150,18 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--until", type=str, default=None, help="Only include PRs created before this date YYYY-MM-DD")
     p.add_argument("--state", type=str, default="all", choices=["open", "closed", "all"], help="PR state filter")
     p.add_argument("--out-dir", type=str, default="./data", help="Output directory for CSV files (default: ./data)")
-    p.add_argument("--sleep", type=float, default=0.0, help="Optional sleep seconds between API calls")
+    p.add_argument("--format", type=str, default="csv", choices=["csv", "sqlite"], help="Output format; sqlite resumes without re-reading the whole file (export with export_csv.py)")
+    p.add_argument("--sleep", type=float, default=0.0, help="Optional sleep seconds between API calls (disables concurrent fetching)")
     p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="HTTP timeout seconds (increase if you get timeout errors)")
     p.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Number of retries for failed requests")
     p.add_argument("--force-full-refresh", action="store_true", help="Force full refresh, ignore existing data")
+    p.add_argument("--http-cache", type=str, default=DEFAULT_HTTP_CACHE, help=f"HTTP cache file for ETag revalidation (default: {DEFAULT_HTTP_CACHE})")
+    p.add_argument("--no-http-cache", action="store_true", help="Disable the HTTP cache")
     return p.parse_args()
 
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    return datetime.strptime(value, ISO_FORMAT).replace(tzinfo=timezone.utc) if value else None
+
 def get_token() -> str:
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if not token:
@@ -70,6 +172,10 @@ def get_token() -> str:
 def dt_from_iso8601(s: Optional[str]) -> Optional[datetime]:
     if not s:
         return None
+    # GitHub always sends "YYYY-MM-DDTHH:MM:SSZ", so slice that shape directly
+    if len(s) == 20 and s[-1] == "Z":
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                        int(s[11:13]), int(s[14:16]), int(s[17:19]), tzinfo=timezone.utc)
     return datetime.fromisoformat(s.replace("Z", "+00:00")).astimezone(timezone.utc)
 
 def hours_between(a: Optional[datetime], b: Optional[datetime]) -> Optional[float]:
@@ -85,38 +191,104 @@ def within_range(created_at: datetime, since_dt: Optional[datetime], until_dt: O
         return False
     return True
 
-def _calculate_backoff(attempt: int) -> int:
-    """Calculate exponential backoff wait time in seconds."""
-    return (attempt + 1) * 2  # 2s, 4s, 6s, etc.
-
-def gh_get(session: requests.Session, url: str, token: str, params: Dict = None, timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES) -> requests.Response:
-    headers = {
+def create_session(token: str, cache_path: Optional[str] = None) -> requests.Session:
+    """Create a session with a keep-alive pool sized for concurrent calls to api.github.com.
+
+    With a cache_path, GET responses are stored on disk and revalidated with their ETag,
+    so repeat fetches come back as 304s that don't count against the rate limit.
+    """
+    if cache_path:
+        session = requests_cache.CachedSession(
+            cache_path,
+            backend="sqlite",
+            cache_control=True,
+            expire_after=requests_cache.EXPIRE_IMMEDIATELY,  # Without Cache-Control, always revalidate
+            allowable_methods=("GET",),
+            allowable_codes=(200,),
+        )
+    else:
+        session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+    session.mount("https://", adapter)
+    session.headers.update({
         "Accept": "application/vnd.github+json",
         "Authorization": f"Bearer {token}",
         "X-GitHub-Api-Version": "2022-11-28",
         "User-Agent": "gh-pr-times-script"
-    }
-
+    })
+    return session
+
+# Every thread that calls the API (main, prefetch, refresh, request and page workers) takes a slot
+# for the duration of the HTTP call, so in-flight requests never outnumber the pooled connections.
+_request_slots = threading.BoundedSemaphore(MAX_IN_FLIGHT_REQUESTS)
+
+def set_request_concurrency(limit: int) -> None:
+    """Change how many API requests this process may have in flight at once."""
+    global _request_slots
+    _request_slots = threading.BoundedSemaphore(max(1, limit))
+
+_request_executor: Optional[ThreadPoolExecutor] = None
+
+def get_request_executor() -> ThreadPoolExecutor:
+    """Shared pool for concurrent per-PR API calls."""
+    global _request_executor
+    if _request_executor is None:
+        _request_executor = ThreadPoolExecutor(max_workers=REQUEST_WORKERS, thread_name_prefix="gh-request")
+    return _request_executor
+
+_page_executor: Optional[ThreadPoolExecutor] = None
+
+def get_page_executor() -> ThreadPoolExecutor:
+    """Shared pool for fetching the remaining pages of a paginated endpoint.
+
+    Kept separate from the request executor because callers running on that pool block on these futures.
+    """
+    global _page_executor
+    if _page_executor is None:
+        _page_executor = ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS, thread_name_prefix="gh-page")
+    return _page_executor
+
+def _calculate_backoff(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Calculate exponential backoff wait time in seconds, jittered so concurrent retries don't line up."""
+    return min(cap, base * (2 ** attempt)) + random.uniform(0, base)  # ~1s, ~2s, ~4s, etc.
+
+def _rate_limit_wait(resp: requests.Response, attempt: int) -> float:
+    """Seconds to wait after a rate-limited response: Retry-After, else until the reset time, else backoff."""
+    retry_after = resp.headers.get("retry-after")
+    reset = resp.headers.get("x-ratelimit-reset")
+    try:
+        if retry_after:
+            return int(retry_after) + random.uniform(0, BACKOFF_BASE)
+        if reset:
+            return max(0, int(reset) - int(time.time())) + 1 + random.uniform(0, BACKOFF_BASE)
+    except ValueError:
+        pass
+    return _calculate_backoff(attempt)
+
+def _json(resp: requests.Response):
+    """Decode a JSON response body with orjson (faster than resp.json() and skips charset detection)."""
+    return orjson.loads(resp.content)
+
+def gh_request(session: requests.Session, method: str, url: str, params: Optional[Dict] = None, json_body: Optional[Dict] = None,
+               timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES) -> requests.Response:
     for attempt in range(retries):
         try:
-            resp = session.get(url, headers=headers, params=params or {}, timeout=timeout)
-
-            # Handle rate limiting
-            if resp.status_code == 403 and "rate limit" in resp.text.lower():
-                reset = resp.headers.get("x-ratelimit-reset")
-                if reset:
-                    try:
-                        wait_for = max(0, int(reset) - int(time.time())) + 1
-                        print(f"⏳ Rate limited. Sleeping {wait_for}s until reset...", file=sys.stderr)
-                        time.sleep(wait_for)
-                        resp = session.get(url, headers=headers, params=params or {}, timeout=timeout)
-                    except Exception:
-                        pass
+            with _request_slots:
+                resp = session.request(method, url, params=params, json=json_body, timeout=timeout)
+
+            # Handle rate limiting. Detected from headers so the body is never read:
+            # primary limits exhaust x-ratelimit-remaining, secondary limits send retry-after.
+            if resp.status_code in (403, 429) and (resp.headers.get("x-ratelimit-remaining") == "0" or "retry-after" in resp.headers):
+                if attempt < retries - 1:
+                    wait_time = _rate_limit_wait(resp, attempt)
+                    print(f"⏳ Rate limited. Sleeping {wait_time:.0f}s... (attempt {attempt + 1}/{retries})", file=sys.stderr)
+                    time.sleep(wait_time)
+                    continue
 
             # Handle server errors with retry
             if resp.status_code >= 500 and attempt < retries - 1:
                 wait_time = _calculate_backoff(attempt)
-                print(f"⚠️  Server error {resp.status_code}. Retrying in {wait_time}s... (attempt {attempt + 1}/{retries})", file=sys.stderr)
+                print(f"⚠️  Server error {resp.status_code}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{retries})", file=sys.stderr)
                 time.sleep(wait_time)
                 continue
 
@@ -126,7 +298,7 @@ def gh_get(session: requests.Session, url: str, token: str, params: Dict = None,
         except requests.exceptions.Timeout:
             if attempt < retries - 1:
                 wait_time = _calculate_backoff(attempt)
-                print(f"⚠️  Request timeout. Retrying in {wait_time}s... (attempt {attempt + 1}/{retries})", file=sys.stderr)
+                print(f"⚠️  Request timeout. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{retries})", file=sys.stderr)
                 time.sleep(wait_time)
                 continue
             else:
@@ -134,7 +306,7 @@ def gh_get(session: requests.Session, url: str, token: str, params: Dict = None,
         except requests.exceptions.RequestException as e:
             if attempt < retries - 1:
                 wait_time = _calculate_backoff(attempt)
-                print(f"⚠️  Request error: {e}. Retrying in {wait_time}s... (attempt {attempt + 1}/{retries})", file=sys.stderr)
+                print(f"⚠️  Request error: {e}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{retries})", file=sys.stderr)
                 time.sleep(wait_time)
                 continue
             else:
@@ -142,73 +314,280 @@ def gh_get(session: requests.Session, url: str, token: str, params: Dict = None,
 
     raise requests.exceptions.HTTPError(f"Failed after {retries} attempts")
 
-def paginate(session: requests.Session, url: str, token: str, params: Dict, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> Iterable[List[Dict]]:
+def gh_get(session: requests.Session, url: str, params: Optional[Dict] = None, timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES) -> requests.Response:
+    return gh_request(session, "GET", url, params=params, timeout=timeout, retries=retries)
+
+def gh_graphql(session: requests.Session, query: str, variables: Dict, timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES) -> Dict:
+    """Run a GraphQL query and return its "data" payload."""
+    resp = gh_request(session, "POST", GRAPHQL_URL, json_body={"query": query, "variables": variables},
+                      timeout=timeout, retries=retries)
+    payload = _json(resp)
+    if payload.get("errors"):
+        messages = "; ".join(err.get("message", str(err)) for err in payload["errors"])
+        raise RuntimeError(f"GraphQL query failed: {messages}")
+    return payload["data"]
+
+def _last_page(resp: requests.Response) -> int:
+    """Return the last page number advertised in the Link header (1 if there is no rel="last")."""
+    last_url = resp.links.get("last", {}).get("url")
+    if not last_url:
+        return 1
+    page = parse_qs(urlparse(last_url).query).get("page")
+    return int(page[0]) if page else 1
+
+def fetch_page(session: requests.Session, url: str, params: Optional[Dict], page: int, timeout: float,
+               retries: int = DEFAULT_RETRIES) -> Tuple[requests.Response, List[Dict]]:
+    q = dict(params or {})
+    q["page"] = page
+    q["per_page"] = PER_PAGE_LIMIT
+    resp = gh_get(session, url, q, timeout=timeout, retries=retries)
+    items = _json(resp)
+    if not isinstance(items, list):
+        raise RuntimeError(f"Unexpected response for pagination at {url}: {items}")
+    return resp, items
+
+def paginate(session: requests.Session, url: str, params: Optional[Dict], timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES,
+             parallel: bool = False) -> Iterable[List[Dict]]:
+    """Yield pages of results. With parallel=True, pages after the first are fetched concurrently and yielded as they arrive.
+
+    A positive sleep_s always pages sequentially, so --sleep keeps throttling every call.
+    """
     page = 1
     while True:
-        q = dict(params or {})
-        q["page"] = page
-        q["per_page"] = PER_PAGE_LIMIT
-        resp = gh_get(session, url, token, q, timeout=timeout, retries=retries)
-        items = resp.json()
-        if not isinstance(items, list):
-            raise RuntimeError(f"Unexpected response for pagination at {url}: {items}")
+        resp, items = fetch_page(session, url, params, page, timeout, retries)
         if not items:
             break
         yield items
+        if parallel and sleep_s <= 0:
+            # Page 1's Link header tells us how many pages remain, so request them all at once
+            executor = get_page_executor()
+            futures = [executor.submit(fetch_page, session, url, params, p, timeout, retries)
+                       for p in range(2, _last_page(resp) + 1)]
+            for future in as_completed(futures):
+                _, batch = future.result()
+                if batch:
+                    yield batch
+            break
         page += 1
         if sleep_s > 0:
             time.sleep(sleep_s)
 
-def fetch_reviews(session: requests.Session, token: str, owner: str, repo: str, pr_number: int, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> List[Dict]:
+def fetch_reviews(session: requests.Session, owner: str, repo: str, pr_number: int, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> List[Dict]:
     url = f"{API_ROOT}/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
     all_reviews: List[Dict] = []
-    for batch in paginate(session, url, token, {}, timeout, sleep_s, retries):
+    for batch in paginate(session, url, None, timeout, sleep_s, retries, parallel=True):
         all_reviews.extend(batch)
     return all_reviews
 
-def fetch_issue_comments(session: requests.Session, token: str, owner: str, repo: str, pr_number: int, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> List[Dict]:
+def fetch_issue_comments(session: requests.Session, owner: str, repo: str, pr_number: int, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> List[Dict]:
     """Fetch issue comments (comments on the PR conversation)."""
     url = f"{API_ROOT}/repos/{owner}/{repo}/issues/{pr_number}/comments"
     all_comments: List[Dict] = []
-    for batch in paginate(session, url, token, {}, timeout, sleep_s, retries):
+    for batch in paginate(session, url, None, timeout, sleep_s, retries, parallel=True):
         all_comments.extend(batch)
     return all_comments
 
-def fetch_review_comments(session: requests.Session, token: str, owner: str, repo: str, pr_number: int, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> List[Dict]:
+def fetch_review_comments(session: requests.Session, owner: str, repo: str, pr_number: int, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> List[Dict]:
     """Fetch review comments (inline code review comments)."""
     url = f"{API_ROOT}/repos/{owner}/{repo}/pulls/{pr_number}/comments"
     all_comments: List[Dict] = []
-    for batch in paginate(session, url, token, {}, timeout, sleep_s, retries):
+    for batch in paginate(session, url, None, timeout, sleep_s, retries, parallel=True):
         all_comments.extend(batch)
     return all_comments
 
-def fetch_prs(session: requests.Session, token: str, owner: str, repo: str, state: str, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> Iterable[Dict]:
-    url = f"{API_ROOT}/repos/{owner}/{repo}/pulls"
-    params = {"state": state, "sort": "created", "direction": "desc"}
-    for batch in paginate(session, url, token, params, timeout, sleep_s, retries):
-        for pr in batch:
-            yield pr
-
-def enrich_pr(session: requests.Session, token: str, owner: str, repo: str, pr_number: int, timeout: float, retries: int = DEFAULT_RETRIES) -> Dict:
+def enrich_pr(session: requests.Session, owner: str, repo: str, pr_number: int, timeout: float, retries: int = DEFAULT_RETRIES) -> Dict:
     # Pull the full PR details for counts like additions, deletions, changed_files, commits
     url = f"{API_ROOT}/repos/{owner}/{repo}/pulls/{pr_number}"
-    resp = gh_get(session, url, token, timeout=timeout, retries=retries)
-    return resp.json()
+    resp = gh_get(session, url, timeout=timeout, retries=retries)
+    return _json(resp)
+
+def fetch_prs_graphql(session: requests.Session, owner: str, repo: str, state: str, cursor: Optional[str],
+                      timeout: float, retries: int = DEFAULT_RETRIES) -> Dict:
+    """Fetch one page of PRs (newest first) with reviews and comments included."""
+    variables = {
+        "owner": owner,
+        "repo": repo,
+        "cursor": cursor,
+        "states": GRAPHQL_STATES[state],
+        "pageSize": GRAPHQL_PAGE_SIZE,
+    }
+    data = gh_graphql(session, PRS_GRAPHQL_QUERY, variables, timeout, retries)
+    repository = data.get("repository")
+    if repository is None:
+        raise RuntimeError(f"Repository {owner}/{repo} not found")
+    return repository["pullRequests"]
+
+def iter_prs_graphql(session: requests.Session, owner: str, repo: str, state: str,
+                     timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES,
+                     since_dt: Optional[datetime] = None) -> Iterable[Dict]:
+    """Yield PR nodes newest first. Paging stops after the page that reaches back past since_dt."""
+    cursor = None
+    while True:
+        connection = fetch_prs_graphql(session, owner, repo, state, cursor, timeout, retries)
+        nodes = connection["nodes"]
+        for node in nodes:
+            yield node
+        page_info = connection["pageInfo"]
+        if not page_info["hasNextPage"]:
+            break
+        # Don't request (or prefetch) a page that would only hold PRs older than since_dt
+        if since_dt and nodes:
+            oldest = dt_from_iso8601(nodes[-1].get("createdAt"))
+            if oldest and oldest < since_dt:
+                break
+        cursor = page_info["endCursor"]
+        if sleep_s > 0:
+            time.sleep(sleep_s)
+
+_PREFETCH_DONE = object()
+
+def iter_in_background(items: Iterable, maxsize: int = PREFETCH_QUEUE_SIZE) -> Iterable:
+    """Yield from an iterable that is advanced on a background thread, so its network I/O
+    overlaps the consumer's work. Errors are re-raised in the consumer; stopping early stops the producer.
+    """
+    q: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(entry: Tuple) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((_PREFETCH_DONE, e))
+            return
+        put((_PREFETCH_DONE, None))
 
-def fetch_single_pr(session: requests.Session, token: str, owner: str, repo: str, pr_number: int, timeout: float, retries: int = DEFAULT_RETRIES) -> Optional[Dict]:
+    threading.Thread(target=produce, name="gh-prefetch", daemon=True).start()
+    try:
+        while True:
+            item, error = q.get()
+            if item is _PREFETCH_DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+def fetch_single_pr(session: requests.Session, owner: str, repo: str, pr_number: int, timeout: float, retries: int = DEFAULT_RETRIES) -> Optional[Dict]:
     """Fetch a single PR by number. Returns None if PR doesn't exist."""
     try:
         url = f"{API_ROOT}/repos/{owner}/{repo}/pulls/{pr_number}"
-        resp = gh_get(session, url, token, timeout=timeout, retries=retries)
-        return resp.json()
+        resp = gh_get(session, url, timeout=timeout, retries=retries)
+        return _json(resp)
     except requests.exceptions.HTTPError as e:
         if e.response and e.response.status_code == 404:
             return None
         raise
 
-def process_pr_data(session: requests.Session, token: str, owner: str, repo: str, repo_key: str,
+def _graphql_user(actor: Optional[Dict]) -> Dict:
+    """Convert a GraphQL actor to the REST "user" shape (bots keep their [bot] suffix)."""
+    if not actor or not actor.get("login"):
+        # GraphQL returns null for deleted accounts where REST returns the "ghost" user
+        return {"login": GHOST_LOGIN}
+    login = actor["login"]
+    if actor.get("__typename") == "Bot":
+        login = f"{login}[bot]"
+    return {"login": login}
+
+def pr_from_graphql(node: Dict) -> Dict:
+    """Convert a GraphQL PR node to the fields used from the REST PR payload."""
+    return {
+        "number": node.get("number"),
+        "title": node.get("title"),
+        "html_url": node.get("url"),
+        "user": _graphql_user(node.get("author")),
+        "draft": node.get("isDraft"),
+        "created_at": node.get("createdAt"),
+        "closed_at": node.get("closedAt"),
+        "merged_at": node.get("mergedAt"),
+        "additions": node.get("additions"),
+        "deletions": node.get("deletions"),
+        "changed_files": node.get("changedFiles"),
+        "commits": (node.get("commits") or {}).get("totalCount"),
+    }
+
+def process_graphql_pr(session: requests.Session, owner: str, repo: str, repo_key: str,
+                       node: Dict, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> Dict:
+    """Process a PR fetched via GraphQL, falling back to REST only for truncated connections."""
+    pr = pr_from_graphql(node)
+    pr_number = pr["number"]
+    review_conn = node.get("reviews") or {}
+    comment_conn = node.get("comments") or {}
+
+    if (review_conn.get("pageInfo") or {}).get("hasNextPage"):
+        reviews = fetch_reviews(session, owner, repo, pr_number, timeout, sleep_s, retries)
+        review_comments = fetch_review_comments(session, owner, repo, pr_number, timeout, sleep_s, retries)
+    else:
+        reviews = []
+        review_comments = []
+        for review in review_conn.get("nodes") or []:
+            user = _graphql_user(review.get("author"))
+            reviews.append({"state": review.get("state"), "submitted_at": review.get("submittedAt"), "user": user})
+            # Only per-author counts are needed, so one entry per inline comment is enough
+            review_comments.extend([{"user": user}] * (review.get("comments") or {}).get("totalCount", 0))
+
+    if (comment_conn.get("pageInfo") or {}).get("hasNextPage"):
+        issue_comments = fetch_issue_comments(session, owner, repo, pr_number, timeout, sleep_s, retries)
+    else:
+        issue_comments = [{"user": _graphql_user(c.get("author"))} for c in comment_conn.get("nodes") or []]
+
+    return build_pr_row(repo_key, pr, pr, reviews, issue_comments, review_comments)
+
+def _run_inline(fn, *args) -> Future:
+    """Run fn immediately and wrap the outcome in a Future, for code paths that normally submit to a pool."""
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+def process_pr_data(session: requests.Session, owner: str, repo: str, repo_key: str,
                    pr: Dict, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> Dict:
-    """Process a PR and return a CSV row dict with all the data."""
+    """Process a PR via the REST API and return a CSV row dict with all the data."""
+    pr_number = pr.get("number")
+    # The endpoints are independent, so issue them concurrently. A full PR payload
+    # (e.g. from fetch_single_pr) already has the size stats, so enrich_pr is skipped.
+    # It also counts comments, so endpoints known to be empty are skipped (reviews aren't counted).
+    # With --sleep the calls run one after another so the pause applies between each of them.
+    submit = get_request_executor().submit if sleep_s <= 0 else _run_inline
+    full = None if "additions" in pr else submit(enrich_pr, session, owner, repo, pr_number, timeout, retries)
+    reviews = submit(fetch_reviews, session, owner, repo, pr_number, timeout, sleep_s, retries)
+    issue_comments = None
+    if pr.get("comments") != 0:
+        issue_comments = submit(fetch_issue_comments, session, owner, repo, pr_number, timeout, sleep_s, retries)
+    review_comments = None
+    if pr.get("review_comments") != 0:
+        review_comments = submit(fetch_review_comments, session, owner, repo, pr_number, timeout, sleep_s, retries)
+    return build_pr_row(repo_key, pr, full.result() if full else pr, reviews.result(),
+                        issue_comments.result() if issue_comments else [],
+                        review_comments.result() if review_comments else [])
+
+def refresh_open_pr(session: requests.Session, owner: str, repo: str, repo_key: str,
+                    pr_number: int, timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> Optional[Dict]:
+    """Return an updated row if a previously open PR has since been closed or merged, else None."""
+    pr = fetch_single_pr(session, owner, repo, pr_number, timeout, retries)
+    row = None
+    if pr and (pr.get("closed_at") or pr.get("merged_at")):
+        row = process_pr_data(session, owner, repo, repo_key, pr, timeout, sleep_s, retries)
+    if sleep_s > 0:
+        time.sleep(sleep_s)
+    return row
+
+def build_pr_row(repo_key: str, pr: Dict, full: Dict, reviews: List[Dict],
+                 issue_comments: List[Dict], review_comments: List[Dict]) -> Dict:
+    """Compute the CSV row dict for a PR from its details, reviews and comments."""
     pr_number = pr.get("number")
     created_at = dt_from_iso8601(pr.get("created_at"))
     merged_at = dt_from_iso8601(pr.get("merged_at"))
@@ -218,43 +597,41 @@ def process_pr_data(session: requests.Session, token: str, owner: str, repo: str
     title = pr.get("title") or ""
     draft = bool(pr.get("draft"))
 
-    # Enrich to get size stats
-    full = enrich_pr(session, token, owner, repo, pr_number, timeout, retries)
+    # Size stats
     additions = full.get("additions")
     deletions = full.get("deletions")
     changed_files = full.get("changed_files")
     commits = full.get("commits")
 
-    # Reviews
-    reviews = fetch_reviews(session, token, owner, repo, pr_number, timeout, sleep_s, retries)
+    # Reviews and approvals (reviews with state APPROVED) in a single pass.
+    # submitted_at is a UTC ISO-8601 string, so the smallest string is the earliest review.
     reviews_count = len(reviews)
-    first_review_at = None
-    if reviews:
-        try:
-            first_review_at = min(
-                (dt_from_iso8601(r.get("submitted_at")) for r in reviews if r.get("submitted_at")),
-                default=None
-            )
-        except Exception:
-            first_review_at = None
-
-    # Approvals (from reviews with state APPROVED)
-    approvals = [r for r in reviews if r.get("state") == "APPROVED"]
-    approvals_count = len(approvals)
-    approval_authors = list(set((r.get("user") or {}).get("login") for r in approvals if (r.get("user") or {}).get("login")))
+    earliest_iso = None
+    approvals_count = 0
+    approval_authors = set()
+    for r in reviews:
+        submitted = r.get("submitted_at")
+        if submitted and (earliest_iso is None or submitted < earliest_iso):
+            earliest_iso = submitted
+        if r.get("state") == "APPROVED":
+            approvals_count += 1
+            user = r.get("user")
+            if user and user.get("login"):
+                approval_authors.add(user["login"])
     approval_authors_str = ",".join(sorted(approval_authors))
 
-    # Comments (both issue comments and review comments)
-    issue_comments = fetch_issue_comments(session, token, owner, repo, pr_number, timeout, sleep_s, retries)
-    review_comments = fetch_review_comments(session, token, owner, repo, pr_number, timeout, sleep_s, retries)
-    all_comments = issue_comments + review_comments
-    comments_count = len(all_comments)
-
-    # Count comments per author
-    comment_counts_by_author = {}
-    for comment in all_comments:
-        author_login = (comment.get("user") or {}).get("login")
-        if author_login:
+    try:
+        first_review_at = dt_from_iso8601(earliest_iso)
+    except ValueError:
+        first_review_at = None
+
+    # Comments (both issue comments and review comments), counted per author without joining the lists
+    comments_count = len(issue_comments) + len(review_comments)
+    comment_counts_by_author: Dict[str, int] = {}
+    for comment in chain(issue_comments, review_comments):
+        user = comment.get("user")
+        if user and user.get("login"):
+            author_login = user["login"]
             comment_counts_by_author[author_login] = comment_counts_by_author.get(author_login, 0) + 1
 
     # Format as "author:count,author:count"
@@ -296,284 +673,453 @@ def process_pr_data(session: requests.Session, token: str, owner: str, repo: str
         "approval_authors": approval_authors_str,
     }
 
-def count_prs(session: requests.Session, token: str, owner: str, repo: str, state: str,
-              since_dt: Optional[datetime], until_dt: Optional[datetime], timeout: float, sleep_s: float, retries: int = DEFAULT_RETRIES) -> int:
-    """Count total PRs that match the criteria without fetching full details."""
-    count = 0
-    for pr in fetch_prs(session, token, owner, repo, state, timeout, sleep_s, retries):
-        created_at = dt_from_iso8601(pr.get("created_at"))
-        if not created_at:
-            continue
-        if not within_range(created_at, since_dt, until_dt):
-            if since_dt and created_at < since_dt:
-                break
-            continue
-        count += 1
-    return count
-
-def get_csv_filename(owner: str, repo: str, out_dir: str) -> str:
-    """Generate CSV filename for a specific repo."""
+def _search_created_qualifier(since_dt: Optional[datetime], until_dt: Optional[datetime]) -> str:
+    """Build a search "created:" qualifier with the same bounds as within_range (since inclusive, until exclusive)."""
+    if not since_dt and not until_dt:
+        return ""
+    lower = since_dt.strftime(SEARCH_TIME_FORMAT) if since_dt else "*"
+    upper = (until_dt - timedelta(seconds=1)).strftime(SEARCH_TIME_FORMAT) if until_dt else "*"
+    return f"created:{lower}..{upper}"
+
+def count_prs_by_pages(session: requests.Session, owner: str, repo: str, state: str,
+                       since_dt: Optional[datetime], until_dt: Optional[datetime], timeout: float, retries: int = DEFAULT_RETRIES) -> int:
+    """Count PRs that match the criteria from the REST PR list without walking every page.
+
+    The list is sorted newest first, so the number of PRs created at or after a date is found by
+    binary searching pages for the boundary, using the Link header's rel="last" for the page count.
+    """
+    url = f"{API_ROOT}/repos/{owner}/{repo}/pulls"
+    params = {"state": state, "sort": "created", "direction": "desc"}
+    pages: Dict[int, List[Dict]] = {}
+
+    def get_page(page: int) -> List[Dict]:
+        if page not in pages:
+            _, pages[page] = fetch_page(session, url, params, page, timeout, retries)
+        return pages[page]
+
+    resp, pages[1] = fetch_page(session, url, params, 1, timeout, retries)
+    last_page = _last_page(resp)
+
+    def count_created_since(threshold: Optional[datetime]) -> int:
+        if threshold is None:
+            return (last_page - 1) * PER_PAGE_LIMIT + len(get_page(last_page))
+        # Find the first page whose oldest PR is before the threshold
+        lo, hi = 1, last_page
+        while lo < hi:
+            mid = (lo + hi) // 2
+            items = get_page(mid)
+            if items and dt_from_iso8601(items[-1].get("created_at")) < threshold:
+                hi = mid
+            else:
+                lo = mid + 1
+        newer = sum(1 for pr in get_page(lo) if dt_from_iso8601(pr.get("created_at")) >= threshold)
+        return (lo - 1) * PER_PAGE_LIMIT + newer
+
+    if not pages[1]:
+        return 0
+    return max(0, count_created_since(since_dt) - (count_created_since(until_dt) if until_dt else 0))
+
+def count_prs(session: requests.Session, owner: str, repo: str, state: str,
+              since_dt: Optional[datetime], until_dt: Optional[datetime], timeout: float, retries: int = DEFAULT_RETRIES) -> int:
+    """Count PRs that match the criteria with a single Search API request, falling back to the PR list."""
+    qualifiers = [f"repo:{owner}/{repo}", "is:pr", _search_created_qualifier(since_dt, until_dt), SEARCH_STATE_QUALIFIERS[state]]
+    params = {"q": " ".join(q for q in qualifiers if q), "per_page": 1}
+    try:
+        resp = gh_get(session, f"{API_ROOT}/search/issues", params, timeout=timeout, retries=retries)
+        return _json(resp)["total_count"]
+    except requests.exceptions.RequestException as e:
+        print(f"⚠️  Search API unavailable ({e}). Counting from the PR list instead...", file=sys.stderr)
+        return count_prs_by_pages(session, owner, repo, state, since_dt, until_dt, timeout, retries)
+
+def get_output_filename(owner: str, repo: str, out_dir: str, fmt: str = "csv") -> str:
+    """Generate the CSV or SQLite filename for a specific repo."""
     # Sanitize repo name for filesystem
     safe_name = f"{owner}_{repo}".replace("/", "_").replace("\\", "_")
-    csv_filename = f"{safe_name}.csv"
+    filename = f"{safe_name}.{fmt}"
 
     # Ensure output directory exists
     os.makedirs(out_dir, exist_ok=True)
 
-    return os.path.join(out_dir, csv_filename)
+    return os.path.join(out_dir, filename)
 
-def load_existing_csv(csv_path: str, repo_key: str) -> Tuple[List[Dict], Optional[datetime], set, set]:
-    """Load existing CSV data and find latest PR date, already-processed PRs, and open PRs for this specific repo."""
-    existing_rows = []
-    latest_date = None
+def load_existing_csv(csv_path: str, repo_key: str) -> Tuple[int, Optional[datetime], set, set]:
+    """Scan existing CSV data in one pass for the row count, plus the latest PR date, already-processed PRs, and open PRs for this specific repo."""
+    row_count = 0
+    latest_created = None  # created_at values are written by this script as UTC ISO strings, so they sort chronologically
     processed_prs = set()  # Set of PR numbers
     open_prs = set()  # Set of PR numbers that are currently open
 
     if not os.path.exists(csv_path):
-        return existing_rows, latest_date, processed_prs, open_prs
+        return row_count, None, processed_prs, open_prs
 
     try:
         with open(csv_path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return row_count, None, processed_prs, open_prs
+            columns = {name: i for i, name in enumerate(header)}
+            repo_i = columns["repo"]
+            number_i = columns["number"]
+            created_i = columns["created_at"]
+            closed_i = columns["closed_at"]
+            merged_i = columns["merged_at"]
+            width = max(repo_i, number_i, created_i, closed_i, merged_i) + 1
+
             for row in reader:
-                existing_rows.append(row)
+                row_count += 1
 
                 # Only track PRs for this specific repo
-                if row.get("repo") == repo_key:
-                    # Track which PRs we've already processed
-                    number = row.get("number")
-                    if number:
-                        processed_prs.add(str(number))
-
-                        # Track PRs that are currently open (not closed, not merged)
-                        if not row.get("closed_at") and not row.get("merged_at"):
-                            open_prs.add(str(number))
-
-                    # Track latest creation date
-                    created_at = dt_from_iso8601(row.get("created_at"))
-                    if created_at:
-                        if latest_date is None or created_at > latest_date:
-                            latest_date = created_at
-    except Exception as e:
-        print(f"⚠️  Warning: Could not read existing CSV: {e}", file=sys.stderr)
+                if len(row) < width or row[repo_i] != repo_key:
+                    continue
 
-    return existing_rows, latest_date, processed_prs, open_prs
+                # Track which PRs we've already processed
+                number = row[number_i]
+                if number:
+                    processed_prs.add(number)
 
-def main() -> None:
-    args = parse_args()
-    token = get_token()
-    since_dt = datetime.strptime(args.since, ISO_FORMAT).replace(tzinfo=timezone.utc) if args.since else None
-    until_dt = datetime.strptime(args.until, ISO_FORMAT).replace(tzinfo=timezone.utc) if args.until else None
+                    # Track PRs that are currently open (not closed, not merged)
+                    if not row[closed_i] and not row[merged_i]:
+                        open_prs.add(number)
 
-    # Print job summary
-    print("=" * 60, file=sys.stderr)
-    print("🚀 GitHub PR Review Times Analyzer", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
-    print(f"Repositories: {', '.join(args.repos)}", file=sys.stderr)
-    print(f"State filter: {args.state}", file=sys.stderr)
-    if since_dt:
-        print(f"Since: {args.since}", file=sys.stderr)
-    if until_dt:
-        print(f"Until: {args.until}", file=sys.stderr)
-    print(f"Output directory: {args.out_dir}", file=sys.stderr)
-    print(f"Mode: {'Full Refresh (ignoring existing data)' if args.force_full_refresh else 'Auto-Resume (smart incremental)'}", file=sys.stderr)
-    print("=" * 60, file=sys.stderr)
-
-    session = requests.Session()
-
-    fieldnames = [
-        "repo", "number", "title", "url", "author", "draft",
-        "created_at", "closed_at", "merged_at",
-        "additions", "deletions", "changed_files", "commits",
-        "reviews_count", "first_review_at", "time_to_first_review_hours",
-        "time_to_merge_hours", "open_time_hours",
-        "comments_count", "comment_authors", "approvals_count", "approval_authors"
-    ]
+                # Track latest creation date
+                created = row[created_i]
+                if created and (latest_created is None or created > latest_created):
+                    latest_created = created
+    except Exception as e:
+        print(f"⚠️  Warning: Could not read existing CSV: {e}", file=sys.stderr)
 
-    for repo_full in args.repos:
-        if "/" not in repo_full:
-            print(f"Skipping invalid repo identifier: {repo_full}", file=sys.stderr)
-            continue
-        owner, repo = repo_full.split("/", 1)
-        repo_key = f"{owner}/{repo}"
-
-        # Generate CSV filename for this repo
-        out_path = get_csv_filename(owner, repo, args.out_dir)
-        file_exists = os.path.exists(out_path)
-
-        # Load existing data to check what we already have
-        existing_rows = []
-        latest_date = None
-        processed_prs = set()
-        open_prs = set()
-
-        if file_exists and not args.force_full_refresh:
-            print(f"\n📂 Loading existing data from {out_path}...", file=sys.stderr)
-            existing_rows, latest_date, processed_prs, open_prs = load_existing_csv(out_path, repo_key)
-            if existing_rows:
-                print(f"✓ Found {len(existing_rows)} existing PRs", file=sys.stderr)
-                if latest_date:
-                    print(f"  └─ Latest PR: {latest_date.strftime('%Y-%m-%d %H:%M')}", file=sys.stderr)
-                    print(f"  └─ Will fetch only newer PRs", file=sys.stderr)
-                if open_prs:
-                    print(f"  └─ Found {len(open_prs)} previously open PRs to check for updates", file=sys.stderr)
-
-        # Check and update previously open PRs
-        updated_prs = {}  # Maps PR number to updated row dict
-        if open_prs and not args.force_full_refresh:
-            print(f"\n🔄 Checking status of {len(open_prs)} previously open PRs...", file=sys.stderr)
-            pbar_update = tqdm(total=len(open_prs), desc=f"Updating {owner}/{repo}", unit="PR", file=sys.stderr)
-
-            for pr_number_str in open_prs:
-                pr_number = int(pr_number_str)
+    return row_count, dt_from_iso8601(latest_created), processed_prs, open_prs
+
+def rewrite_csv_rows(csv_path: str, repo_key: str, updated_rows: Dict[str, Dict]) -> None:
+    """Stream the CSV into a temp file, swapping in updated rows for this repo, then replace the original."""
+    tmp_path = f"{csv_path}.tmp"
+    with open(csv_path, "r", newline="", encoding="utf-8") as src, \
+            open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst)
+        header = next(reader)
+        writer.writerow(header)
+        repo_i = header.index("repo")
+        number_i = header.index("number")
+        for row in reader:
+            if len(row) > max(repo_i, number_i) and row[repo_i] == repo_key and row[number_i] in updated_rows:
+                updated = updated_rows[row[number_i]]
+                row = [updated.get(name, "") for name in header]
+            writer.writerow(row)
+    os.replace(tmp_path, csv_path)
+
+def open_sqlite(db_path: str) -> sqlite3.Connection:
+    """Open (creating if needed) the SQLite store, with one row per (repo, number)."""
+    conn = sqlite3.connect(db_path)
+    columns = ", ".join(f"{name} {SQLITE_COLUMN_TYPES.get(name, 'TEXT')}" for name in CSV_FIELDNAMES)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS prs ({columns}, PRIMARY KEY (repo, number))")
+    return conn
+
+def load_existing_sqlite(db_path: str, repo_key: str) -> Tuple[int, Optional[datetime], set, set]:
+    """Same as load_existing_csv, answered by indexed queries instead of a full file scan."""
+    conn = open_sqlite(db_path)
+    try:
+        row_count = conn.execute("SELECT COUNT(*) FROM prs").fetchone()[0]
+        latest_created = conn.execute("SELECT MAX(created_at) FROM prs WHERE repo = ?", (repo_key,)).fetchone()[0]
+        processed_prs = {str(n) for (n,) in conn.execute("SELECT number FROM prs WHERE repo = ?", (repo_key,))}
+        open_prs = {str(n) for (n,) in conn.execute(
+            "SELECT number FROM prs WHERE repo = ? AND closed_at IS NULL AND merged_at IS NULL", (repo_key,))}
+    finally:
+        conn.close()
+    return row_count, dt_from_iso8601(latest_created), processed_prs, open_prs
+
+def upsert_sqlite_rows(conn: sqlite3.Connection, rows: List[Dict]) -> None:
+    """Insert or replace row dicts, storing empty values as NULL."""
+    placeholders = ", ".join("?" for _ in CSV_FIELDNAMES)
+    conn.executemany(
+        f"INSERT OR REPLACE INTO prs ({', '.join(CSV_FIELDNAMES)}) VALUES ({placeholders})",
+        [[None if row.get(name) == "" else row.get(name) for name in CSV_FIELDNAMES] for row in rows],
+    )
+    conn.commit()
+
+def process_repo(repo_full: str, args: argparse.Namespace, token: str, position: int = 0,
+                 max_in_flight: int = MAX_IN_FLIGHT_REQUESTS) -> Tuple[str, int, int]:
+    """Fetch new and updated PRs for one repo into its CSV. Returns (repo, PRs added, PRs skipped).
+
+    Runs in its own worker process when several repos are scanned, so it opens its own session
+    and is limited to its max_in_flight share of the token's concurrent requests.
+    """
+    set_request_concurrency(max_in_flight)
+    since_dt = parse_date(args.since)
+    until_dt = parse_date(args.until)
+    session = create_session(token, None if args.no_http_cache else args.http_cache)
+
+    owner, repo = repo_full.split("/", 1)
+    repo_key = f"{owner}/{repo}"
+
+    # Generate output filename for this repo
+    use_sqlite = args.format == "sqlite"
+    out_path = get_output_filename(owner, repo, args.out_dir, args.format)
+    file_exists = os.path.exists(out_path)
+
+    # Load existing data to check what we already have
+    existing_count = 0
+    latest_date = None
+    processed_prs = set()
+    open_prs = set()
+
+    if file_exists and not args.force_full_refresh:
+        print(f"\n📂 Loading existing data from {out_path}...", file=sys.stderr)
+        load_existing = load_existing_sqlite if use_sqlite else load_existing_csv
+        existing_count, latest_date, processed_prs, open_prs = load_existing(out_path, repo_key)
+        if existing_count:
+            print(f"✓ Found {existing_count} existing PRs", file=sys.stderr)
+            if latest_date:
+                print(f"  └─ Latest PR: {latest_date.strftime('%Y-%m-%d %H:%M')}", file=sys.stderr)
+                print(f"  └─ Will fetch only newer PRs", file=sys.stderr)
+            if open_prs:
+                print(f"  └─ Found {len(open_prs)} previously open PRs to check for updates", file=sys.stderr)
+
+    # Check and update previously open PRs
+    updated_prs = {}  # Maps PR number to updated row dict
+    if open_prs and not args.force_full_refresh:
+        print(f"\n🔄 Checking status of {len(open_prs)} previously open PRs...", file=sys.stderr)
+        pbar_update = tqdm(total=len(open_prs), desc=f"Updating {owner}/{repo}", unit="PR", file=sys.stderr, position=position)
+
+        # With --sleep, refresh one PR at a time so the pause still spaces out API calls
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PRS if args.sleep <= 0 else 1) as executor:
+            futures = {
+                executor.submit(refresh_open_pr, session, owner, repo, repo_key, int(pr_number_str),
+                                args.timeout, args.sleep, args.retries): pr_number_str
+                for pr_number_str in open_prs
+            }
+            for future in as_completed(futures):
+                pr_number_str = futures[future]
                 try:
-                    # Fetch current state of this PR
-                    pr = fetch_single_pr(session, token, owner, repo, pr_number, args.timeout, args.retries)
-                    if pr:
-                        # Check if PR is now closed or merged
-                        if pr.get("closed_at") or pr.get("merged_at"):
-                            pbar_update.set_postfix_str(f"PR #{pr_number}: {'merged' if pr.get('merged_at') else 'closed'}")
-                            # Process the PR data
-                            row = process_pr_data(session, token, owner, repo, repo_key, pr,
-                                                args.timeout, args.sleep, args.retries)
-                            updated_prs[pr_number_str] = row
+                    row = future.result()
+                    if row:
+                        pbar_update.set_postfix_str(f"PR #{pr_number_str}: {'merged' if row['merged_at'] else 'closed'}")
+                        updated_prs[pr_number_str] = row
                 except Exception as e:
-                    print(f"\n⚠️  Error updating PR #{pr_number}: {e}", file=sys.stderr)
+                    print(f"\n⚠️  Error updating PR #{pr_number_str}: {e}", file=sys.stderr)
 
                 pbar_update.update(1)
-                if args.sleep > 0:
-                    time.sleep(args.sleep)
-
-            pbar_update.close()
-
-            if updated_prs:
-                print(f"✓ Found {len(updated_prs)} PRs that have been closed/merged", file=sys.stderr)
-                # Update existing_rows with new data
-                for i, row in enumerate(existing_rows):
-                    if row.get("repo") == repo_key and row.get("number") in updated_prs:
-                        existing_rows[i] = updated_prs[row.get("number")]
-
-                # Rewrite the CSV with updated data
-                print(f"📝 Updating {out_path} with latest PR statuses...", file=sys.stderr)
-                with open(out_path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(existing_rows)
-
-                # Remove updated PRs from processed_prs so they won't be skipped when fetching
-                # Actually, keep them in processed_prs since we just updated them
-                print(f"✓ Updated CSV with latest status", file=sys.stderr)
-
-        # Determine the effective "since" date (latest of user-provided or latest in file)
-        effective_since_dt = since_dt
-        if latest_date and not args.force_full_refresh:
-            # Resume from latest PR date
-            if since_dt is None or latest_date > since_dt:
-                effective_since_dt = latest_date
-
-        # Count total PRs first
-        print(f"\n📊 Counting new PRs in {owner}/{repo}...", file=sys.stderr)
-        total_prs = count_prs(session, token, owner, repo, args.state, effective_since_dt, until_dt, args.timeout, args.sleep, args.retries)
-        print(f"✓ Found {total_prs} new PRs to process", file=sys.stderr)
-
-        if total_prs == 0:
-            if updated_prs:
-                # We updated some PRs but have no new PRs to fetch
-                print(f"✓ Completed {owner}/{repo} - updated {len(updated_prs)} existing PRs", file=sys.stderr)
-            else:
-                print(f"⚠️  No new PRs found. Skipping.", file=sys.stderr)
-            continue
 
-        # Open CSV file (append if exists and not forcing refresh, otherwise write new)
-        append_mode = file_exists and not args.force_full_refresh
-        mode = "a" if append_mode else "w"
-        csv_file = open(out_path, mode, newline="", encoding="utf-8")
-        csv_writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+        pbar_update.close()
 
-        if append_mode:
-            print(f"📝 Appending to {out_path}", file=sys.stderr)
+        if updated_prs:
+            print(f"✓ Found {len(updated_prs)} PRs that have been closed/merged", file=sys.stderr)
+            # Rewrite the stored rows with updated data
+            print(f"📝 Updating {out_path} with latest PR statuses...", file=sys.stderr)
+            if use_sqlite:
+                conn = open_sqlite(out_path)
+                upsert_sqlite_rows(conn, list(updated_prs.values()))
+                conn.close()
+            else:
+                rewrite_csv_rows(out_path, repo_key, updated_prs)
+
+            # Remove updated PRs from processed_prs so they won't be skipped when fetching
+            # Actually, keep them in processed_prs since we just updated them
+            print(f"✓ Updated {out_path} with latest status", file=sys.stderr)
+
+    # Determine the effective "since" date (latest of user-provided or latest in file)
+    effective_since_dt = since_dt
+    if latest_date and not args.force_full_refresh:
+        # Resume from latest PR date
+        if since_dt is None or latest_date > since_dt:
+            effective_since_dt = latest_date
+
+    # Count total PRs first
+    print(f"\n📊 Counting new PRs in {owner}/{repo}...", file=sys.stderr)
+    total_prs = count_prs(session, owner, repo, args.state, effective_since_dt, until_dt, args.timeout, args.retries)
+    print(f"✓ Found {total_prs} new PRs to process", file=sys.stderr)
+
+    if total_prs == 0:
+        if updated_prs:
+            # We updated some PRs but have no new PRs to fetch
+            print(f"✓ Completed {owner}/{repo} - updated {len(updated_prs)} existing PRs", file=sys.stderr)
         else:
+            print(f"⚠️  No new PRs found. Skipping.", file=sys.stderr)
+        return repo_key, 0, 0
+
+    # Open output (append if exists and not forcing refresh, otherwise write new)
+    append_mode = file_exists and not args.force_full_refresh
+    if use_sqlite:
+        conn = open_sqlite(out_path)
+        if not append_mode:
+            conn.execute("DELETE FROM prs")
+        write_rows = partial(upsert_sqlite_rows, conn)
+        close_output = conn.close
+    else:
+        csv_file = open(out_path, "a" if append_mode else "w", newline="", encoding="utf-8")
+        csv_writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDNAMES)
+        if not append_mode:
             csv_writer.writeheader()
-            print(f"📝 Creating new file {out_path}", file=sys.stderr)
+        write_rows = csv_writer.writerows
+        close_output = csv_file.close
 
-        new_prs_count = 0
-        skipped_prs_count = 0
+    if append_mode:
+        print(f"📝 Appending to {out_path}", file=sys.stderr)
+    else:
+        print(f"📝 Creating new file {out_path}", file=sys.stderr)
 
-        # Process PRs with progress bar
-        pbar = tqdm(total=total_prs, desc=f"Processing {owner}/{repo}", unit="PR", file=sys.stderr)
+    new_prs_count = 0
+    skipped_prs_count = 0
+    row_buffer: List[Dict] = []
 
-        try:
-            for pr in fetch_prs(session, token, owner, repo, args.state, args.timeout, args.sleep, args.retries):
-                created_at = dt_from_iso8601(pr.get("created_at"))
-                if not created_at:
-                    continue
-                if not within_range(created_at, effective_since_dt, until_dt):
-                    # Stop early if results are in descending created order and we went past the since date
-                    if effective_since_dt and created_at < effective_since_dt:
-                        break
-                    continue
+    # Process PRs with progress bar
+    pbar = tqdm(total=total_prs, desc=f"Processing {owner}/{repo}", unit="PR", file=sys.stderr, position=position)
 
-                pr_number = pr.get("number")
+    try:
+        # Pages are fetched on a background thread while rows are built and written here
+        pr_nodes = iter_prs_graphql(session, owner, repo, args.state, args.timeout, args.sleep, args.retries,
+                                    since_dt=effective_since_dt)
+        for node in iter_in_background(pr_nodes):
+            created_at = dt_from_iso8601(node.get("createdAt"))
+            if not created_at:
+                continue
+            if not within_range(created_at, effective_since_dt, until_dt):
+                # Stop early if results are in descending created order and we went past the since date
+                if effective_since_dt and created_at < effective_since_dt:
+                    break
+                continue
 
-                # Skip if we've already processed this PR
-                if str(pr_number) in processed_prs:
-                    skipped_prs_count += 1
-                    pbar.update(1)
-                    continue
+            pr_number = node.get("number")
 
-                pr_title = pr.get("title") or ""
-                # Update progress bar with current PR info
-                pbar.set_postfix_str(f"PR #{pr_number}: {pr_title[:40]}{'...' if len(pr_title) > 40 else ''}")
+            # Skip if we've already processed this PR
+            if str(pr_number) in processed_prs:
+                skipped_prs_count += 1
+                pbar.update(1)
+                continue
 
-                try:
-                    # Process the PR data
-                    row = process_pr_data(session, token, owner, repo, repo_key, pr,
-                                        args.timeout, args.sleep, args.retries)
+            pr_title = node.get("title") or ""
+            # Update progress bar with current PR info
+            pbar.set_postfix_str(f"PR #{pr_number}: {pr_title[:40]}{'...' if len(pr_title) > 40 else ''}")
 
-                    # Write row immediately to CSV
-                    csv_writer.writerow(row)
-                    csv_file.flush()  # Ensure data is written to disk
-                    new_prs_count += 1
+            try:
+                # Process the PR data
+                row = process_graphql_pr(session, owner, repo, repo_key, node,
+                                       args.timeout, args.sleep, args.retries)
 
-                except Exception as e:
-                    print(f"\n⚠️  Error processing PR #{pr_number}: {e}", file=sys.stderr)
-                    print(f"   Skipping this PR and continuing...", file=sys.stderr)
+                row_buffer.append(row)
+                new_prs_count += 1
 
-                pbar.update(1)
+            except Exception as e:
+                print(f"\n⚠️  Error processing PR #{pr_number}: {e}", file=sys.stderr)
+                print(f"   Skipping this PR and continuing...", file=sys.stderr)
 
-        except KeyboardInterrupt:
-            print(f"\n\n⚠️  Interrupted by user. Partial data has been saved.", file=sys.stderr)
-            pbar.close()
-            csv_file.close()
-            sys.exit(1)
-        except Exception as e:
-            print(f"\n\n❌ Error: {e}", file=sys.stderr)
-            print(f"   Partial data has been saved to {out_path}", file=sys.stderr)
-            pbar.close()
-            csv_file.close()
-            sys.exit(1)
+            pbar.update(1)
 
+            # Write rows out in batches; a write failure aborts the repo rather than skipping a PR
+            if len(row_buffer) >= CSV_WRITE_BATCH:
+                batch = row_buffer[:]
+                row_buffer.clear()
+                write_rows(batch)
+
+    except KeyboardInterrupt:
+        print(f"\n\n⚠️  Interrupted by user. Partial data has been saved.", file=sys.stderr)
+        pbar.close()
+        write_rows(row_buffer)
+        close_output()
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n\n❌ Error: {e}", file=sys.stderr)
+        print(f"   Partial data has been saved to {out_path}", file=sys.stderr)
         pbar.close()
+        write_rows(row_buffer)
+        close_output()
+        sys.exit(1)
 
-        # Close the CSV file for this repo
-        csv_file.close()
-
-        # Print summary for this repo
-        print(f"\n✓ Completed {owner}/{repo}", file=sys.stderr)
-        total_in_file = len(existing_rows) + new_prs_count
-        if file_exists and not args.force_full_refresh:
-            print(f"  └─ Added {new_prs_count} new PRs", file=sys.stderr)
-            if skipped_prs_count > 0:
-                print(f"  └─ Skipped {skipped_prs_count} already-processed PRs", file=sys.stderr)
-            print(f"  └─ Total PRs in {out_path}: {total_in_file}", file=sys.stderr)
-        else:
-            print(f"  └─ Wrote {new_prs_count} PRs to {out_path}", file=sys.stderr)
+    pbar.close()
+
+    # Write any remaining rows and close the output for this repo
+    write_rows(row_buffer)
+    close_output()
+
+    # Print summary for this repo
+    print(f"\n✓ Completed {owner}/{repo}", file=sys.stderr)
+    total_in_file = existing_count + new_prs_count
+    if file_exists and not args.force_full_refresh:
+        print(f"  └─ Added {new_prs_count} new PRs", file=sys.stderr)
+        if skipped_prs_count > 0:
+            print(f"  └─ Skipped {skipped_prs_count} already-processed PRs", file=sys.stderr)
+        print(f"  └─ Total PRs in {out_path}: {total_in_file}", file=sys.stderr)
+    else:
+        print(f"  └─ Wrote {new_prs_count} PRs to {out_path}", file=sys.stderr)
+
+    return repo_key, new_prs_count, skipped_prs_count
+
+def main() -> None:
+    args = parse_args()
+    token = get_token()
+    since_dt = parse_date(args.since)
+    until_dt = parse_date(args.until)
+
+    # Print job summary
+    print("=" * 60, file=sys.stderr)
+    print("🚀 GitHub PR Review Times Analyzer", file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
+    print(f"Repositories: {', '.join(args.repos)}", file=sys.stderr)
+    print(f"State filter: {args.state}", file=sys.stderr)
+    if since_dt:
+        print(f"Since: {args.since}", file=sys.stderr)
+    if until_dt:
+        print(f"Until: {args.until}", file=sys.stderr)
+    print(f"Output directory: {args.out_dir}", file=sys.stderr)
+    print(f"Mode: {'Full Refresh (ignoring existing data)' if args.force_full_refresh else 'Auto-Resume (smart incremental)'}", file=sys.stderr)
+    print("=" * 60, file=sys.stderr)
+
+    repos = []
+    for repo_full in args.repos:
+        if "/" not in repo_full:
+            print(f"Skipping invalid repo identifier: {repo_full}", file=sys.stderr)
+            continue
+        repos.append(repo_full)
+
+    # Repos share nothing, so scan them in parallel processes, each with its own session and pool
+    results = []
+    failed = []
+    max_workers = min(len(repos), MAX_PARALLEL_REPOS)
+    if max_workers <= 1:
+        for repo_full in repos:
+            try:
+                results.append(process_repo(repo_full, args, token))
+            except (Exception, SystemExit) as e:
+                # SystemExit is how process_repo reports a failure it has already printed
+                if not isinstance(e, SystemExit):
+                    print(f"\n❌ Error processing {repo_full}: {e}", file=sys.stderr)
+                failed.append(repo_full)
+    else:
+        # All processes share one token, so split the in-flight request budget between them
+        max_in_flight = MAX_IN_FLIGHT_REQUESTS // max_workers
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(process_repo, repo_full, args, token, position, max_in_flight): repo_full
+                for position, repo_full in enumerate(repos)
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        results.append(future.result())
+                    except (Exception, SystemExit) as e:
+                        # SystemExit is how process_repo reports a failure it has already printed
+                        if not isinstance(e, SystemExit):
+                            print(f"\n❌ Error processing {futures[future]}: {e}", file=sys.stderr)
+                        failed.append(futures[future])
+            except KeyboardInterrupt:
+                for future in futures:
+                    future.cancel()
+                print(f"\n\n⚠️  Interrupted by user. Partial data has been saved.", file=sys.stderr)
+                sys.exit(1)
 
     # Final summary
     print("\n" + "=" * 60, file=sys.stderr)
-    print(f"✅ All repositories processed!", file=sys.stderr)
-    print(f"   CSV files saved in: {args.out_dir}", file=sys.stderr)
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}", file=sys.stderr)
+    else:
+        print(f"✅ All repositories processed!", file=sys.stderr)
+    for repo_key, added, skipped in results:
+        print(f"   {repo_key}: {added} new PRs, {skipped} skipped", file=sys.stderr)
+    print(f"   {'SQLite' if args.format == 'sqlite' else 'CSV'} files saved in: {args.out_dir}", file=sys.stderr)
     print("=" * 60, file=sys.stderr)
+    if failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()